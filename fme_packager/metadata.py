@@ -1,6 +1,9 @@
 import json
 import os
+from functools import lru_cache
 
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from ruamel.yaml import YAML
 
 
@@ -25,6 +28,30 @@ def load_metadata_json_schema():
         return json.load(f)
 
 
+@lru_cache(maxsize=None)
+def _metadata_validator():
+    """
+    Build the validator for the package metadata specification.
+    The schema is loaded and checked once, then reused for every package.
+    """
+    schema = load_metadata_json_schema()
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def validate_metadata(metadata_dict):
+    """
+    Validate package metadata against the package metadata specification.
+
+    :param dict metadata_dict: Parsed contents of package.yml.
+    :raises jsonschema.exceptions.ValidationError: If the metadata is invalid.
+    """
+    error = best_match(_metadata_validator().iter_errors(metadata_dict))
+    if error is not None:
+        raise error
+
+
 class TransformerMetadata:
     def __init__(self, metadata_dict):
         self.dict = metadata_dict
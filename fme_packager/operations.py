@@ -1,6 +1,5 @@
 import os
 from collections import namedtuple
-from pathlib import Path
 
 
 def split_fpkg_filename(filename):
@@ -36,6 +35,8 @@ def build_fpkg_filename(publisher_uid, package_uid, version):
 FORMATINFO_HDR = "FORMAT_NAME|FORMAT_LONG_NAME|DATASET_TYPE|DIRECTION|AUTOMATED_TRANSLATION_FLAG|COORDSYS_AWARE|FILTER|FORMAT_TYPE|USE_NATIVE_SPATIAL_INDEX|SOURCE_SETTINGS|DESTINATION_SETTINGS|VISIBLE|MIN_VERSION|MAX_VERSION|FORMAT_FAMILY|HAS_SIDECARS|MARKETING_FAMILY|FORMAT_CATEGORIES"
 FormatInfo = namedtuple("FormatInfo", FORMATINFO_HDR.replace("|", " "), defaults=[""])
 OPTIONAL_FORMATINFO_COLUMNS = ["FORMAT_CATEGORIES"]
+_NUM_FORMATINFO_COLUMNS = len(FormatInfo._fields)
+_NUM_REQUIRED_FORMATINFO_COLUMNS = _NUM_FORMATINFO_COLUMNS - len(OPTIONAL_FORMATINFO_COLUMNS)
 
 
 def parse_formatinfo(line) -> FormatInfo:
@@ -45,13 +46,11 @@ def parse_formatinfo(line) -> FormatInfo:
     :param str line: raw format info.
     :return: Parsed format into a FormatInfo named tuple.
     """
-    num_columns = len(FORMATINFO_HDR.split("|"))
-    num_required_columns = num_columns - len(OPTIONAL_FORMATINFO_COLUMNS)
     parts = line.strip().split("|")
-    if len(parts) not in [num_columns, num_required_columns]:
+    if len(parts) not in (_NUM_FORMATINFO_COLUMNS, _NUM_REQUIRED_FORMATINFO_COLUMNS):
         raise ValueError(
             "FormatInfo has {} elements, but expects at least {}".format(
-                len(parts), num_required_columns
+                len(parts), _NUM_REQUIRED_FORMATINFO_COLUMNS
             )
         )
     return FormatInfo(*parts)
@@ -82,10 +81,3 @@ def valid_fpkg_file(fpkg_file: str) -> str:
         raise ValueError("The file must exist and have a .fpkg extension")
 
     return fpkg_file
-
-
-def zip_filename_for_fpkg(directory: str, fpkg_file: str) -> Path:
-    """
-    Generate a zip file path
-    """
-    return Path(directory) / os.path.basename(fpkg_file[:-5] + ".zip")
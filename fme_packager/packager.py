@@ -1,5 +1,6 @@
 import csv
 import os
+import re
 import shutil
 import tempfile
 import warnings
@@ -10,15 +11,13 @@ from pathlib import Path
 import png
 import xmltodict
 from build import ProjectBuilder
-from jsonschema import validate
-from packaging import version
 
 from fme_packager.exception import (
     TransformerPythonCompatError,
     CustomTransformerPythonCompatError,
 )
 from fme_packager.help import HelpBuilder
-from fme_packager.metadata import load_fpkg_metadata, load_metadata_json_schema, TransformerMetadata
+from fme_packager.metadata import load_fpkg_metadata, validate_metadata, TransformerMetadata
 from fme_packager.operations import (
     build_fpkg_filename,
     parse_formatinfo,
@@ -27,6 +26,11 @@ from fme_packager.operations import (
 from fme_packager.transformer import load_transformer, CustomTransformer
 
 
+# Python 3 PYTHON_COMPATIBILITY values are "3" followed by the minor version, like "36" or "310".
+PYTHON3_COMPATIBILITY_PATTERN = re.compile(r"3[0-9]+")
+MIN_PYTHON_COMPATIBILITY = 35
+
+
 def is_valid_python_compatibility(python_compat_version):
     """
     Checks for a valid python compatibility value.
@@ -34,14 +38,10 @@ def is_valid_python_compatibility(python_compat_version):
     :param str python_compat_version: Python compatibility version
     :rtype: bool
     """
-    minimum_requirement = "35"
-    is_python_3 = python_compat_version.startswith("3")
-    meets_minimum_requirements = False
-    if is_python_3:
-        meets_minimum_requirements = version.parse(python_compat_version) >= version.parse(
-            minimum_requirement
-        )
-    return is_python_3 and meets_minimum_requirements
+    return (
+        PYTHON3_COMPATIBILITY_PATTERN.fullmatch(python_compat_version) is not None
+        and int(python_compat_version) >= MIN_PYTHON_COMPATIBILITY
+    )
 
 
 def check_exists_and_copy(src, dest):
@@ -189,7 +189,7 @@ class FMEPackager:
 
         self.fmt_visible_directions = {}
 
-        validate(self.metadata.dict, load_metadata_json_schema())
+        validate_metadata(self.metadata.dict)
 
     def apply_help(self, help_src):
         """
@@ -493,17 +493,19 @@ class FMEPackager:
         wheels_dest = self.build_dir / "python"
         wheels_dest.mkdir(parents=True)
 
-        for path in self.src_python_dir.iterdir():
-            if os.path.isfile(path) and path.suffix == ".whl":
-                shutil.copy(path, wheels_dest)
-
-            built_wheels_dir = path / "dist"
-            if built_wheels_dir.is_dir():
-                built_wheels_for_lib = [
-                    name for name in built_wheels_dir.iterdir() if name.suffix == ".whl"
-                ]
-                assert len(built_wheels_for_lib) == 1
-                shutil.copy(built_wheels_for_lib[0], wheels_dest)
+        with os.scandir(self.src_python_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and os.path.splitext(entry.name)[1] == ".whl":
+                    shutil.copy(entry.path, wheels_dest)
+                    continue
+
+                built_wheels_dir = Path(entry.path) / "dist"
+                if entry.is_dir() and built_wheels_dir.is_dir():
+                    built_wheels_for_lib = [
+                        name for name in built_wheels_dir.iterdir() if name.suffix == ".whl"
+                    ]
+                    assert len(built_wheels_for_lib) == 1
+                    shutil.copy(built_wheels_for_lib[0], wheels_dest)
 
     def _check_wheels(self):
         wheels_path = self.build_dir / "python"
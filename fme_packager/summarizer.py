@@ -1,20 +1,25 @@
 import json
 import os
-import shutil
 import tempfile
+import zipfile
 from collections import namedtuple
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Set
 
 import yaml
 from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
-from fme_packager.operations import valid_fpkg_file, zip_filename_for_fpkg, parse_formatinfo
+from fme_packager.operations import valid_fpkg_file, parse_formatinfo
 from fme_packager.packager import _load_format_line
 from fme_packager.transformer import load_transformer, TransformerFile, Transformer
 from fme_packager.utils import chdir
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlSafeLoader
+
 
 def _unpack_fpkg_file(directory: str, fpkg_file: str):
     """
@@ -24,10 +29,8 @@ def _unpack_fpkg_file(directory: str, fpkg_file: str):
     :param fpkg_file: The FME Package file to be unpacked.
     :return: The directory where the FME Package file was unpacked.
     """
-    valid_fpkg = valid_fpkg_file(fpkg_file)
-    zip_file = zip_filename_for_fpkg(directory, valid_fpkg)
-    shutil.copy(valid_fpkg, zip_file)
-    shutil.unpack_archive(zip_file, directory)
+    with zipfile.ZipFile(valid_fpkg_file(fpkg_file)) as fpkg_zip:
+        fpkg_zip.extractall(directory)
 
     return directory
 
@@ -49,8 +52,8 @@ def _parsed_manifest(yaml_file: Path) -> dict:
     :param yaml_file: The path to the manifest yaml file.
     :return: A dictionary of the parsed YAML.
     """
-    with open(yaml_file, "r") as file:
-        return yaml.safe_load(file)
+    with open(yaml_file, "rb") as file:
+        return yaml.load(file, Loader=YamlSafeLoader)
 
 
 TransformerFilenames = namedtuple(
@@ -62,7 +65,40 @@ FormatFilenames = namedtuple(
 )
 
 
-def _transformer_filenames(transformer_name: str) -> TransformerFilenames:
+def _existing_filenames(directory: str) -> Set[str]:
+    """
+    List the files in a directory with a single scandir call.
+
+    Filenames are normalized with os.path.normcase, which only folds case on Windows.
+    Other case-insensitive filesystems, like the macOS default, need _is_existing_file.
+
+    :param directory: The directory to list.
+    :return: The normalized filenames, or an empty set if the directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def _is_existing_file(path: str, existing_filenames: Set[str]) -> bool:
+    """
+    Check whether a file exists, using a directory listing from _existing_filenames first.
+
+    A name that misses the listing is checked on disk,
+    so files whose case differs from the name are still found on case-insensitive filesystems.
+
+    :param path: The path of the file, relative to the package directory.
+    :param existing_filenames: Filenames in the file's directory, from _existing_filenames.
+    :return: True if the file exists.
+    """
+    return os.path.normcase(os.path.basename(path)) in existing_filenames or os.path.exists(path)
+
+
+def _transformer_filenames(
+    transformer_name: str, existing_filenames: Optional[Set[str]] = None
+) -> TransformerFilenames:
     """
     Retrieve filenames for the transformer and its readme
 
@@ -70,39 +106,51 @@ def _transformer_filenames(transformer_name: str) -> TransformerFilenames:
     - 'name': The name of the transformer.
 
     :param transformer_name: The name of the transformer to retrieve filenames for.
+    :param existing_filenames: Filenames in the transformers directory, from _existing_filenames.
+        If not given, the directory is listed.
     :return: A tuple containing the filename and readme filename.
     """
     if not transformer_name:
         return TransformerFilenames(filename=None, readme_filename=None)
 
+    if existing_filenames is None:
+        existing_filenames = _existing_filenames("transformers")
+
     result = dict()
     for ext, key in [("fmx", "filename"), ("fmxj", "filename"), ("md", "readme_filename")]:
-        potential_filename = str(Path("transformers") / f"{transformer_name}.{ext}")
-        if os.path.exists(potential_filename):
+        potential_filename = os.path.join("transformers", f"{transformer_name}.{ext}")
+        if _is_existing_file(potential_filename, existing_filenames):
             result[key] = potential_filename
 
     return TransformerFilenames(**result)
 
 
-def _format_filenames(format_name: str) -> FormatFilenames:
+def _format_filenames(
+    format_name: str, existing_filenames: Optional[Set[str]] = None
+) -> FormatFilenames:
     """
     Retrieve filenames for the format and its readme
 
     :param format_name: The name of the format to retrieve filenames for.
+    :param existing_filenames: Filenames in the formats directory, from _existing_filenames.
+        If not given, the directory is listed.
     :return: A tuple containing the filename, db filename and readme filename.
     """
     if not format_name:
         return FormatFilenames(filename=None, readme_filename=None, db_filename=None)
 
+    if existing_filenames is None:
+        existing_filenames = _existing_filenames("formats")
+
     filenames = {
-        "filename": str(Path("formats") / f"{format_name}.fmf"),
-        "db_filename": str(Path("formats") / f"{format_name}.db"),
-        "readme_filename": str(Path("formats") / f"{format_name}.md"),
+        "filename": f"{format_name}.fmf",
+        "db_filename": f"{format_name}.db",
+        "readme_filename": f"{format_name}.md",
     }
 
     for key, filename in filenames.items():
-        if not os.path.exists(filename):
-            filenames[key] = None
+        filename = os.path.join("formats", filename)
+        filenames[key] = filename if _is_existing_file(filename, existing_filenames) else None
 
     return FormatFilenames(**filenames)
 
@@ -149,11 +197,10 @@ def _content_description(readme_filename: str) -> dict:
     :return: The update for the transformer or format dictionary.
     """
     try:
-        with open(readme_filename, "r") as file:
-            return {
-                "description": file.read(),
-                "description_format": "md",
-            }
+        return {
+            "description": Path(readme_filename).read_text(encoding="utf8"),
+            "description_format": "md",
+        }
     except OSError:
         return {
             "description": None,
@@ -168,25 +215,16 @@ def _get_all_categories(transformers: Iterable[dict], formats: Iterable[dict]) -
     :param transformers: An iterable of transformer dicts
     :return: An alphabetically sorted list of all categories from the transformers.
     """
-    all_categories = set()
-    for transformer in transformers:
-        if not transformer.get("versions", None):
-            continue
-        highest_version = max(
-            transformer["versions"], key=lambda transformer_version: transformer_version["version"]
-        )
-        if not highest_version["categories"]:
-            continue
-        all_categories.update(highest_version["categories"])
-
-    for format in formats:
-        if not format.get("categories", None):
-            continue
-        all_categories.update(format["categories"])
-
-    all_categories_list = list(all_categories)
-    all_categories_list.sort()
-    return all_categories_list
+    latest_versions = (
+        max(transformer["versions"], key=lambda transformer_version: transformer_version["version"])
+        for transformer in transformers
+        if transformer.get("versions", None)
+    )
+    all_categories = set().union(
+        *(version["categories"] for version in latest_versions if version["categories"]),
+        *(format["categories"] for format in formats if format.get("categories", None)),
+    )
+    return sorted(all_categories)
 
 
 def _enhance_transformer_info(transformers: Iterable[dict]) -> Iterable[dict]:
@@ -199,8 +237,9 @@ def _enhance_transformer_info(transformers: Iterable[dict]) -> Iterable[dict]:
     if not transformers:
         return []
 
+    existing_filenames = _existing_filenames("transformers")
     for transformer in transformers:
-        filenames = _transformer_filenames(transformer["name"])
+        filenames = _transformer_filenames(transformer["name"], existing_filenames)
         loaded_transformer = load_transformer(filenames.filename)
         transformer.update(_transformer_data(loaded_transformer))
         transformer.update(_content_description(filenames.readme_filename))
@@ -257,8 +296,9 @@ def _enhance_format_info(publisher_uid: str, uid: str, formats: Iterable[dict])
     if not formats:
         return []
 
+    existing_filenames = _existing_filenames("formats")
     for format in formats:
-        filenames = _format_filenames(format["name"])
+        filenames = _format_filenames(format["name"], existing_filenames)
         format_data = _format_data(_load_format_line(filenames.db_filename))
         format["short_name"] = format["name"]
         format["name"] = f"{publisher_uid}.{uid}.{format['name']}"
@@ -8,6 +8,8 @@ import re
 from abc import ABC, abstractmethod
 from collections import namedtuple
 
+FMX_PROPERTY_PATTERN = re.compile(r"^(.+?):\s+(.+?)$")
+
 
 class Transformer(ABC):
     """Represents one version of a transformer."""
@@ -115,7 +117,7 @@ class FmxTransformer(Transformer):
         self.lines = lines
         self.props = {}
         for line in self.lines:
-            match = re.match(r"^(.+?):\s+(.+?)$", line)
+            match = FMX_PROPERTY_PATTERN.match(line)
             if match:
                 name = match.group(1).strip()
                 if name.startswith("PARAMETER_"):
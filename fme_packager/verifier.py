@@ -1,8 +1,8 @@
-import shutil
 import tempfile
+import zipfile
 from json import dumps as json_dumps
 
-from fme_packager.operations import valid_fpkg_file, zip_filename_for_fpkg
+from fme_packager.operations import valid_fpkg_file
 from fme_packager.packager import FMEPackager
 
 
@@ -31,13 +31,10 @@ class FMEVerifier:
 
         # Create a temporary directory
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Change the extension of the file to .zip
-            temp_zip_file = str(zip_filename_for_fpkg(temp_dir, self.file))
-            self._print(f"Creating temporary zip file {temp_zip_file}")
-            shutil.copy(self.file, temp_zip_file)
-
-            # Unpack the zip file
-            shutil.unpack_archive(temp_zip_file, temp_dir)
+            # Unpack the fpkg file, which is a zip archive
+            self._print(f"Extracting {self.file} to {temp_dir}")
+            with zipfile.ZipFile(self.file) as zip_file:
+                zip_file.extractall(temp_dir)
 
             # Verify the fpkg files by building the package
             steps = FMEPackager(temp_dir, self.verbose)
@@ -2,33 +2,88 @@
 from __future__ import print_function, unicode_literals, absolute_import, division
 
 import os
-import pathlib
+import shutil
+from functools import lru_cache
 
 import pytest
+from click.testing import CliRunner
 
-FIXTURES_DIR = pathlib.Path(__file__).parent.resolve() / "fixtures"
+from fme_packager.cli import pack
+from fme_packager.packager import FMEPackager
 
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def valid_package_dir():
     return os.path.join(FIXTURES_DIR, "valid_package")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def incompatible_package_dir():
     return os.path.join(FIXTURES_DIR, "incompatible_package")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def custom_package_dir():
     return os.path.join(FIXTURES_DIR, "custom_package")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def incompatible_custom_package_dir():
     return os.path.join(FIXTURES_DIR, "incompatible_custom_package")
 
 
+@pytest.fixture(scope="session")
+def packager_factory():
+    """
+    Return a function that gets the FMEPackager for a fixture package directory.
+
+    Each package directory is loaded once per session,
+    so its package.yml is parsed and validated only once.
+    Tests must not modify the returned packager.
+    """
+
+    @lru_cache(maxsize=None)
+    def _get(package_dir):
+        return FMEPackager(str(package_dir))
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """A click CliRunner shared by all CLI tests. Each invoke() isolates its own I/O."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def built_fpkg(tmp_path_factory, cli_runner):
+    """
+    Return a function that packs a fixture package and returns the path to the built fpkg.
+
+    Each package is packed once per session, so tests that need the same fpkg share it.
+    Packing writes build and dist folders into the package directory,
+    so it works on a copy in a temporary directory instead of the shared fixture.
+    This also keeps tests independent when run in parallel with pytest-xdist.
+    """
+
+    @lru_cache(maxsize=None)
+    def _build(package_name):
+        package_dir = tmp_path_factory.mktemp("pack") / package_name
+        shutil.copytree(
+            os.path.join(FIXTURES_DIR, package_name),
+            package_dir,
+            ignore=shutil.ignore_patterns("build", "dist"),
+        )
+        result = cli_runner.invoke(pack, [str(package_dir)], catch_exceptions=False)
+        assert result.exit_code == 0, result.output
+
+        return next((package_dir / "dist").glob("*.fpkg"))
+
+    return _build
+
+
 @pytest.fixture
 def mock_transformer(mocker):
     mock_transformer = mocker.Mock()
@@ -33,7 +33,7 @@ class TransformerImpl(FMEEnhancedTransformer):
         first_name = param_parser.get(feature, "___XF_FIRST_NAME")
 
         # Set the output attribute, and output the feature.
-        feature.setAttribute("_greeting", "Hello, {}!".format(first_name))
+        feature.setAttribute("_greeting", f"Hello, {first_name}!")
         self.pyoutput(feature)
 
     def process_group(self):
@@ -1,3 +1,4 @@
+import os
 import pathlib
 
 import pytest
@@ -5,11 +6,11 @@ import pytest
 from fme_packager.help import HelpBuilder, get_expected_help_index
 from fme_packager.metadata import FMEPackageMetadata
 
-CWD = pathlib.Path(__file__).parent.resolve()
+CWD = pathlib.Path(os.path.abspath(__file__)).parent
 HELP_FIXTURES_DIR = CWD / "fixtures" / "help"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_metadata():
     return FMEPackageMetadata(
         {
@@ -0,0 +1,15 @@
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from fme_packager.metadata import load_fpkg_metadata, validate_metadata
+
+
+def test_validate_metadata(valid_package_dir):
+    validate_metadata(load_fpkg_metadata(valid_package_dir).dict)
+
+
+def test_validate_metadata_invalid(valid_package_dir):
+    metadata = dict(load_fpkg_metadata(valid_package_dir).dict)
+    del metadata["uid"]
+    with pytest.raises(ValidationError, match="'uid' is a required property"):
+        validate_metadata(metadata)
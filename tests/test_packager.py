@@ -3,9 +3,7 @@ import pathlib
 from zipfile import ZipFile
 
 import pytest
-from click.testing import CliRunner
 
-from fme_packager.cli import pack
 from fme_packager.exception import (
     TransformerPythonCompatError,
     CustomTransformerPythonCompatError,
@@ -13,14 +11,13 @@ from fme_packager.exception import (
 from fme_packager.metadata import TransformerMetadata, FormatMetadata, FMEPackageMetadata
 from fme_packager.operations import parse_formatinfo
 from fme_packager.packager import (
-    FMEPackager,
     is_valid_python_compatibility,
     get_formatinfo,
     get_format_visibility,
 )
 
 
-CWD = pathlib.Path(__file__).parent.resolve()
+CWD = pathlib.Path(os.path.abspath(__file__)).parent
 
 
 @pytest.mark.parametrize(
@@ -33,6 +30,9 @@ CWD = pathlib.Path(__file__).parent.resolve()
         ("35", True),
         ("36", True),
         ("37", True),
+        ("310", True),
+        ("3x", False),
+        ("3\u0665", False),  # only ASCII digits are valid
         ("3.8.9", False),  # 3.x.x is invalid version syntax for PYTHON_COMPATIBILITY
         ("2or3", False),  # only valid for custom transformers
     ],
@@ -41,7 +41,19 @@ def test_is_valid_python_compatibility(version, expected_is_valid):
     assert is_valid_python_compatibility(version) == expected_is_valid
 
 
-def test_get_formatinfo(tmp_path):
+@pytest.mark.parametrize(
+    "filename,expected_format_name",
+    [
+        ("emptyformat.db", None),
+        ("formatnotfound.db", None),
+        ("myformat.db", "EXAMPLE.PACKAGE.MYFORMAT"),
+    ],
+)
+def test_get_formatinfo(filename, expected_format_name):
+    """
+    Read format info from a format's db file in fixtures/formatinfo.
+    If expected_format_name is None, a ValueError is expected.
+    """
     package_metadata = FMEPackageMetadata(
         {
             "uid": "package",
@@ -51,57 +63,43 @@ def test_get_formatinfo(tmp_path):
     )
     format_metadata = FormatMetadata({"name": "myformat"})
 
-    with pytest.raises(ValueError):
-        filepath = tmp_path / "emptyformat.db"
-        with open(filepath, "w") as f:
-            f.write(";")
-        get_formatinfo(package_metadata, format_metadata, filepath)
+    filepath = CWD / "fixtures" / "formatinfo" / filename
+    if expected_format_name is None:
+        with pytest.raises(ValueError):
+            get_formatinfo(package_metadata, format_metadata, filepath)
+    else:
+        formatinfo = get_formatinfo(package_metadata, format_metadata, filepath)
+        assert formatinfo.FORMAT_NAME == expected_format_name
 
-    with pytest.raises(ValueError):
-        filepath = tmp_path / "formatnotfound.db"
-        with open(filepath, "w") as f:
-            f.write(
-                "SAFE.CKAN.CKANDATASTORE|CKAN DataStore|NONE|BOTH|NONE|NO||NON_SPATIAL|NO|YES|YES|YES|3|3|CKAN|NO|CKAN"
-            )
-        get_formatinfo(package_metadata, format_metadata, filepath)
-
-    filepath = tmp_path / "myformat.db"
-    with open(filepath, "w") as f:
-        f.writelines(
-            "EXAMPLE.PACKAGE.MYFORMAT|My Format|NONE|BOTH|NONE|NO||NON_SPATIAL|NO|YES|YES|YES|3|3|MYFORMAT|NO|MYFORMAT|Coordinates\n"
-            + "EXAMPLE.PACKAGE.NOTMYFORMAT|Not My Format|NONE|BOTH|NONE|NO||NON_SPATIAL|NO|YES|YES|YES|3|3|MYFORMAT|NO|MYFORMAT|Coordinates,3D"
-        )
-
-    formatinfo = get_formatinfo(package_metadata, format_metadata, filepath)
-    assert formatinfo.FORMAT_NAME == "EXAMPLE.PACKAGE.MYFORMAT"
-
-
-def test_get_format_visibility():
-    base_formatinfo = parse_formatinfo(
+
+@pytest.fixture(scope="module")
+def base_formatinfo():
+    return parse_formatinfo(
         "EXAMPLE.PACKAGE.MYFORMAT|My Format|NONE|BOTH|NONE|NO||NON_SPATIAL|NO|YES|YES|YES|3|3|MYFORMAT|NO|MYFORMAT|Coordinates"
     )
 
-    assert get_format_visibility(base_formatinfo._replace(DIRECTION="BOTH", VISIBLE="NO")) == ""
-    assert get_format_visibility(base_formatinfo._replace(DIRECTION="BOTH", VISIBLE="YES")) == "rw"
 
-    assert get_format_visibility(base_formatinfo._replace(DIRECTION="BOTH", VISIBLE="INPUT")) == "r"
-    for visibility in ["YES", "INPUT"]:
-        assert (
-            get_format_visibility(base_formatinfo._replace(DIRECTION="INPUT", VISIBLE=visibility))
-            == "r"
-        )
+@pytest.mark.parametrize(
+    "direction,visible,expected",
+    [
+        ("BOTH", "NO", ""),
+        ("BOTH", "YES", "rw"),
+        ("BOTH", "INPUT", "r"),
+        ("INPUT", "YES", "r"),
+        ("INPUT", "INPUT", "r"),
+        ("BOTH", "OUTPUT", "w"),
+        ("OUTPUT", "YES", "w"),
+        ("OUTPUT", "OUTPUT", "w"),
+    ],
+)
+def test_get_format_visibility(base_formatinfo, direction, visible, expected):
+    formatinfo = base_formatinfo._replace(DIRECTION=direction, VISIBLE=visible)
+    assert get_format_visibility(formatinfo) == expected
 
-    assert (
-        get_format_visibility(base_formatinfo._replace(DIRECTION="BOTH", VISIBLE="OUTPUT")) == "w"
-    )
-    for visibility in ["YES", "OUTPUT"]:
-        assert (
-            get_format_visibility(base_formatinfo._replace(DIRECTION="OUTPUT", VISIBLE=visibility))
-            == "w"
-        )
 
+def test_get_format_visibility_incompatible(base_formatinfo):
     with pytest.raises(ValueError):
-        assert get_format_visibility(base_formatinfo._replace(DIRECTION="INPUT", VISIBLE="OUTPUT"))
+        get_format_visibility(base_formatinfo._replace(DIRECTION="INPUT", VISIBLE="OUTPUT"))
 
 
 @pytest.mark.parametrize(
@@ -129,7 +127,7 @@ def test_get_format_visibility():
         ("fmxj_package/transformers/DemoGreeter.fmxj", None, None),
     ],
 )
-def test_validate_transformer(transformer_path, metadata, expected_exc):
+def test_validate_transformer(transformer_path, metadata, expected_exc, packager_factory):
     """
     Load and validate a transformer.
     If expected_exc is given and is an exception, it's expected to be raised.
@@ -139,7 +137,7 @@ def test_validate_transformer(transformer_path, metadata, expected_exc):
     If the transformer has no entry in package.yml, the metadata must be provided.
     """
     transformer_abs_path = CWD / "fixtures" / transformer_path
-    packager = FMEPackager(transformer_abs_path.parent.parent)
+    packager = packager_factory(transformer_abs_path.parent.parent)
     if metadata:
         metadata = TransformerMetadata(metadata)
     else:
@@ -167,13 +165,7 @@ def test_validate_transformer(transformer_path, metadata, expected_exc):
 
 
 @pytest.mark.parametrize("package_name", ["valid_package", "fmxj_package"])
-def test_pack(package_name):
-    runner = CliRunner()
-    result = runner.invoke(pack, [str(CWD / "fixtures" / package_name)])
-    assert result.exit_code == 0
-
+def test_pack(package_name, built_fpkg):
     # Sanity check: expect FPKG to exist and contain package.yml at root level
-    dist_dir = CWD / "fixtures" / package_name / "dist"
-    fpkg_name = os.listdir(dist_dir)[0]
-    with ZipFile(dist_dir / fpkg_name) as z:
+    with ZipFile(built_fpkg(package_name)) as z:
         assert "package.yml" in z.namelist()
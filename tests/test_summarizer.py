@@ -1,11 +1,9 @@
 import json
+import os
 import pathlib
-import tempfile
-from unittest.mock import patch
 
 import pytest
 import yaml
-from click.testing import CliRunner
 from pathlib import Path
 
 from fme_packager import summarizer
@@ -13,7 +11,17 @@ from fme_packager.cli import summarize
 from fme_packager.summarizer import TransformerFilenames, FormatFilenames
 from tests.conftest import mock_transformer, mock_transformer_file
 
-CWD = pathlib.Path(__file__).parent.resolve()
+CWD = pathlib.Path(os.path.abspath(__file__)).parent
+
+# Files that test__transformer_filenames pretends exist in the transformers directory.
+EXISTING_TRANSFORMER_FILES = frozenset(
+    [
+        "fmx_transformer.fmx",
+        "fmx_transformer.md",
+        "fmxj_transformer.fmxj",
+        "fmxj_transformer.md",
+    ]
+)
 
 
 @pytest.mark.parametrize(
@@ -47,30 +55,17 @@ CWD = pathlib.Path(__file__).parent.resolve()
         ),
     ],
 )
-def test__transformer_filenames(transformer_name, expected, mocker):
-    def side_effect(path):
-        if "non_existing_transformer" in path:
-            return False
-        if "fmx_transformer" in path and path.endswith(".fmx"):
-            return True
-        if "fmxj_transformer" in path and path.endswith(".fmxj"):
-            return True
-        if path.endswith(".md"):
-            return True
-        return False
-
-    mocker.patch("os.path.exists", side_effect=side_effect)
-
-    result = summarizer._transformer_filenames(transformer_name)
+def test__transformer_filenames(transformer_name, expected):
+    result = summarizer._transformer_filenames(transformer_name, EXISTING_TRANSFORMER_FILES)
     assert result == expected
 
 
 @pytest.mark.parametrize(
-    "format_name, exists, expected",
+    "format_name, existing_filenames, expected",
     [
         (
             "test_format",
-            True,
+            {"test_format.fmf", "test_format.db", "test_format.md"},
             FormatFilenames(
                 filename=str(Path("formats") / "test_format.fmf"),
                 db_filename=str(Path("formats") / "test_format.db"),
@@ -79,7 +74,7 @@ def test__transformer_filenames(transformer_name, expected, mocker):
         ),
         (
             "non_existing_format",
-            False,
+            {"test_format.fmf", "test_format.db", "test_format.md"},
             FormatFilenames(
                 filename=None,
                 db_filename=None,
@@ -88,10 +83,32 @@ def test__transformer_filenames(transformer_name, expected, mocker):
         ),
     ],
 )
-def test__format_filenames(format_name, exists, expected):
-    with patch("os.path.exists", return_value=exists):
-        result = summarizer._format_filenames(format_name)
-        assert result == expected
+def test__format_filenames(format_name, existing_filenames, expected):
+    result = summarizer._format_filenames(format_name, existing_filenames)
+    assert result == expected
+
+
+def test__existing_filenames(tmp_path):
+    (tmp_path / "MyGreeter.fmx").touch()
+    (tmp_path / "MyGreeter.md").touch()
+    (tmp_path / "subdir.fmx").mkdir()
+
+    assert summarizer._existing_filenames(str(tmp_path)) == {
+        os.path.normcase("MyGreeter.fmx"),
+        os.path.normcase("MyGreeter.md"),
+    }
+    assert summarizer._existing_filenames(str(tmp_path / "missing")) == set()
+
+
+def test__transformer_filenames_missing_from_listing(tmp_path, monkeypatch):
+    # Files not in the listing are still checked on disk,
+    # e.g. names that differ in case on a case-insensitive filesystem.
+    (tmp_path / "transformers").mkdir()
+    (tmp_path / "transformers" / "MyGreeter.fmx").touch()
+    monkeypatch.chdir(tmp_path)
+
+    result = summarizer._transformer_filenames("MyGreeter", set())
+    assert result == TransformerFilenames(filename=os.path.join("transformers", "MyGreeter.fmx"))
 
 
 def test__transformer_data(mock_transformer_file, mock_transformer):
@@ -123,20 +140,7 @@ def test__format_data():
 
 
 @pytest.fixture
-def mock_transformers(mocker):
-    # Mock the TransformerFile object
-    mock_transformer_file1 = mocker.Mock()
-    mock_transformer_file1.versions.return_value = [mocker.Mock(categories={"cat1", "cat2"})]
-
-    mock_transformer_file2 = mocker.Mock()
-    mock_transformer_file2.versions.return_value = [mocker.Mock(categories=None)]
-
-    mock_transformer_file3 = mocker.Mock()
-    mock_transformer_file3.versions.return_value = [mocker.Mock(categories={"cat3", "cat4"})]
-
-    mock_transformer_file4 = mocker.Mock()
-    mock_transformer_file4.versions.return_value = [mocker.Mock(categories={"cat4", "cat5"})]
-
+def mock_transformers():
     return [
         {
             "versions": [
@@ -163,27 +167,24 @@ def test__get_all_categories(mock_transformers, mock_formats):
     assert result == ["cat-f1", "cat-f2", "cat1", "cat2", "cat3", "cat4", "cat5"]
 
 
-def test__add_content_description(mocker):
-    transformer = {"readme_filename": "MyGreeter.md"}
-    mocker.patch("builtins.open", mocker.mock_open(read_data="Test Description"))
-    result = summarizer._content_description(transformer["readme_filename"])
+def test__add_content_description(tmp_path):
+    readme = tmp_path / "MyGreeter.md"
+    readme.write_text("Test Description")
+    result = summarizer._content_description(str(readme))
     assert result["description"] == "Test Description"
     assert result["description_format"] == "md"
 
 
-def test__parsed_manifest():
-    # Create a temporary file
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as temp:
-        # Write some data to the file
-        data = {
-            "key1": "value1",
-            "key2": "value2",
-            "key3": "value3",
-        }
-        yaml.dump(data, temp)
+def test__parsed_manifest(tmp_path):
+    data = {
+        "key1": "value1",
+        "key2": "value2",
+        "key3": "value3",
+    }
+    manifest_path = tmp_path / "package.yml"
+    manifest_path.write_text(yaml.dump(data))
 
-    # Call the function with the path of the temporary file
-    result = summarizer._parsed_manifest(pathlib.Path(temp.name))
+    result = summarizer._parsed_manifest(manifest_path)
 
     # Assert that the returned dictionary matches the data we wrote to the file
     assert result == data
@@ -203,7 +204,7 @@ def test__parsed_manifest():
     ],
 )
 def test_summarize_fpkg(fpkg_path, expected_output_path):
-    expected_output = json.load(open(expected_output_path))
+    expected_output = json.loads(expected_output_path.read_text())
     result = json.loads(summarizer.summarize_fpkg(str(fpkg_path)))
     assert result == expected_output
 
@@ -224,16 +225,15 @@ def test_summarize_empty_fpkg(monkeypatch):
         },
     )
     fpkg_path = CWD / "fixtures" / "fpkgs" / "example.my-package-0.1.0.fpkg"
-    expected_output = json.load(
-        open(CWD / "fixtures" / "json_output" / "summarize_example.empty.json")
+    expected_output = json.loads(
+        (CWD / "fixtures" / "json_output" / "summarize_example.empty.json").read_text()
     )
     result = json.loads(summarizer.summarize_fpkg(str(fpkg_path)))
     assert result == expected_output
 
 
-def test_summarize():
-    runner = CliRunner()
+def test_summarize(cli_runner):
     fpkg_path = str(CWD / "fixtures" / "fpkgs" / "example.my-package-0.1.0.fpkg")
-    result = runner.invoke(summarize, [fpkg_path])
+    result = cli_runner.invoke(summarize, [fpkg_path], catch_exceptions=False)
     assert result.exit_code == 0
     json.loads(result.output)
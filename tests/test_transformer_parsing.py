@@ -10,7 +10,7 @@ from fme_packager.transformer import (
 )
 
 
-CWD = pathlib.Path(__file__).parent.resolve()
+CWD = pathlib.Path(os.path.abspath(__file__)).parent
 
 
 def test_custom_transformer(custom_package_dir):
@@ -1,16 +1,15 @@
+import os
 import pathlib
 
 import pytest
-from click.testing import CliRunner
 
-from fme_packager.cli import verify, pack
+from fme_packager.cli import verify
 
-CWD = pathlib.Path(__file__).parent.resolve()
+CWD = pathlib.Path(os.path.abspath(__file__)).parent
 
 
-def test_verify_valid():
-    runner = CliRunner()
-    result = runner.invoke(
+def test_verify_valid(cli_runner):
+    result = cli_runner.invoke(
         verify, [str(CWD / "fixtures" / "fpkgs" / "example.my-package-0.1.0.fpkg")]
     )
     assert result.exit_code == 0
@@ -18,23 +17,15 @@ def test_verify_valid():
 
 
 @pytest.mark.parametrize("package_name", ["valid_package", "fmxj_package"])
-def test_pack_verify(package_name):
-    runner = CliRunner()
-    # create a fpkg
-    result = runner.invoke(pack, [str(CWD / "fixtures" / package_name)])
-    assert result.exit_code == 0
-
-    # verify the built fpkg
-    dist_dir = CWD / "fixtures" / package_name / "dist"
-    result = runner.invoke(verify, [str(CWD / dist_dir / "example.my-package-0.1.0.fpkg")])
+def test_pack_verify(package_name, built_fpkg, cli_runner):
+    result = cli_runner.invoke(verify, [str(built_fpkg(package_name))])
     assert result.exit_code == 0
     assert "Success" in result.output
 
 
 @pytest.mark.parametrize("flags", [[], ["--json"], ["--verbose"], ["--json", "--verbose"]])
-def test_verify_invalid(flags):
-    runner = CliRunner()
-    result = runner.invoke(
+def test_verify_invalid(flags, cli_runner):
+    result = cli_runner.invoke(
         verify, [str(CWD / "fixtures" / "fpkgs" / "example.invalid-package-0.1.0.fpkg"), *flags]
     )
 
@@ -49,13 +40,11 @@ def test_verify_invalid(flags):
         assert "Working on transformer" not in result.output
 
 
-def test_verify_non_fpkg():
-    runner = CliRunner()
-    result = runner.invoke(verify, [str(CWD / "fixtures" / "valid_package" / "package.yml")])
+def test_verify_non_fpkg(cli_runner):
+    result = cli_runner.invoke(verify, [str(CWD / "fixtures" / "valid_package" / "package.yml")])
     assert "The file must exist and have a .fpkg extension" in result.output
 
 
-def test_verify_non_existent():
-    runner = CliRunner()
-    result = runner.invoke(verify, [str(CWD / "fixtures" / "does-not-exist.fpkg")])
+def test_verify_non_existent(cli_runner):
+    result = cli_runner.invoke(verify, [str(CWD / "fixtures" / "does-not-exist.fpkg")])
     assert "The file must exist and have a .fpkg extension" in result.output